@@ -102,6 +102,14 @@ def create_parser():
             """.format(NAME_TEMPLATE)),
             action="store_true"
             )
+    parser.add_argument(
+            '-v',
+            "--validate",
+            help=textwrap.dedent("""
+            If included checks that the merged graph has no cycle
+            """),
+            action="store_true"
+            )
     parser.add_argument(
             '-c', 
             type=int, 
@@ -121,34 +129,40 @@ def get_input():
         raise ValueError("Did not specify --edges")
     o = args.o
     s = bool(args.show)
-    return num_edges, islands, o, s
+    v = bool(args.validate)
+    return num_edges, islands, o, s, v
 
-def process(islands, num_edges):
-    adj_list = create_acyclic_graph(islands, num_edges)
-    edges_list = adj_to_edges(adj_list)
+def process(islands, num_edges, validate=False):
+    edges_list = create_acyclic_graph(islands, num_edges, validate)
     return edges_list
 
-def create_acyclic_graph(islands, num_edges):
+def create_acyclic_graph(islands, num_edges, validate=False):
+    """Merge the islands into one randomly relabelled edge list.
+
+    Offsetting each island and applying the random mapping is done in a
+    single pass, writing straight into a preallocated list of edges.
+    If validate is set the merged graph is checked for cycles.
+    """
     adj_lists = [ create_island(num_vertices, num_edges)
             for num_vertices,  num_edges in zip(islands, num_edges) ]
-    to_add = [0]
-    for adj_list in adj_lists:
-        to_add.append(to_add[-1] + len(adj_list))
-    if len(adj_lists) > 1:
-        new_adj_lists = [ 
-                [ [vertex + to_add[i] for vertex in vertices ]
-                for vertices in adj_lists[i] ] 
-                for i in range(len(adj_lists))]
-    else:
-        new_adj_lists = adj_lists
-    mapping = list(range(sum(islands)))
+    total_vertices = sum(len(adj_list) for adj_list in adj_lists)
+    total_edges = sum(len(vertices)
+            for adj_list in adj_lists for vertices in adj_list)
+    mapping = list(range(total_vertices))
     random.shuffle(mapping)
-    adj_list = [ vertices for adj_list in new_adj_lists for vertices in adj_list ]
-    random_adj = [None] * len(adj_list)
-    for i in range(len(adj_list)):
-        random_adj[mapping[i]] = [ mapping[vertex] for vertex in adj_list[i] ]
-    assert not acyclic(random_adj)
-    return random_adj
+    edges = [None] * total_edges
+    offset = 0
+    k = 0
+    for adj_list in adj_lists:
+        for i, vertices in enumerate(adj_list):
+            source = mapping[i + offset]
+            for vertex in vertices:
+                edges[k] = (source, mapping[vertex + offset])
+                k += 1
+        offset += len(adj_list)
+    if validate:
+        assert not acyclic(edges_to_adj(total_vertices, edges))
+    return edges
 
 def create_island(num_vertices, num_edges):
     check_edge_vertices(num_vertices, num_edges)
@@ -208,6 +222,12 @@ def adj_to_edges(adj):
     edges = [ [i, vertex] for i in range(len(adj)) for vertex in adj[i] ]
     return edges
 
+def edges_to_adj(num_vertices, edges):
+    adj = [[] for i in range(num_vertices) ]
+    for source, vertex in edges:
+        adj[source].append(vertex)
+    return adj
+
 def edges_to_str(edges_list):
     random.shuffle(edges_list)
     edges_str= "\n".join([ " ".join(str(x+1) for x in item) 
@@ -241,9 +261,9 @@ def get_filename(o, name_template, file_dir):
     return filename, i
 
 def main():
-    num_edges, islands, o, s = get_input()
+    num_edges, islands, o, s, v = get_input()
     show = True
-    edges_list = process(islands, num_edges)
+    edges_list = process(islands, num_edges, v)
     to_output(sum(num_edges), sum(islands), edges_list, o, s)
 
 if __name__ == "__main__":